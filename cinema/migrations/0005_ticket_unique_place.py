@@ -0,0 +1,21 @@
+# Generated by Django 4.1 on 2026-10-15 00:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0004_alter_genre_name'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='ticket',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='ticket',
+            constraint=models.UniqueConstraint(fields=('movie_session', 'row', 'seat'), name='unique_ticket_movie_session_row_seat'),
+        ),
+    ]
@@ -32,7 +32,10 @@ class Actor(models.Model):
 
     @property
     def full_name(self):
-        return f"{self.first_name} {self.last_name}"
+        # Prefer the value annotated in SQL when the queryset provides it.
+        if hasattr(self, "_full_name"):
+            return self._full_name
+        return f"{self.first_name.strip()} {self.last_name.strip()}".strip()
 
 
 class Movie(models.Model):
@@ -61,12 +64,19 @@ class MovieSession(models.Model):
         return self.movie.title + " " + str(self.show_time)
 
 
+class OrderManager(models.Manager):
+    def for_user(self, user) -> models.QuerySet:
+        return self.filter(user=user)
+
+
 class Order(models.Model):
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE
     )
 
+    objects = OrderManager()
+
     def __str__(self):
         return str(self.created_at)
 
@@ -120,4 +130,11 @@ class Ticket(models.Model):
         )
 
     class Meta:
-        unique_together = ("movie_session", "row", "seat")
+        # The unique index also serves the ordered (row, seat) lookups
+        # for a session, so no separate composite index is needed.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["movie_session", "row", "seat"],
+                name="unique_ticket_movie_session_row_seat",
+            )
+        ]
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.db import transaction
-from django.db.models import QuerySet
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
 from cinema.models import (
@@ -24,16 +23,17 @@ class GenreSerializer(serializers.ModelSerializer):
 
 
 class ActorSerializer(serializers.ModelSerializer):
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(read_only=True)
 
     class Meta:
         model = Actor
         fields = ("id", "first_name", "last_name", "full_name")
 
-    def get_full_name(self, obj: Actor) -> str:
-        first = (obj.first_name or "").strip()
-        last = (obj.last_name or "").strip()
-        return f"{first} {last}".strip()
+    def update(self, instance: Actor, validated_data: dict[str, Any]) -> Actor:
+        instance = super().update(instance, validated_data)
+        # The SQL-annotated name was computed before the update.
+        instance.__dict__.pop("_full_name", None)
+        return instance
 
 
 class CinemaHallSerializer(serializers.ModelSerializer):
@@ -45,26 +45,21 @@ class CinemaHallSerializer(serializers.ModelSerializer):
 
 
 class MovieListSerializer(serializers.ModelSerializer):
-    genres = serializers.SerializerMethodField()
-    actors = serializers.SerializerMethodField()
+    genres = serializers.SlugRelatedField(
+        many=True,
+        read_only=True,
+        slug_field="name",
+    )
+    actors = serializers.SlugRelatedField(
+        many=True,
+        read_only=True,
+        slug_field="full_name",
+    )
 
     class Meta:
         model = Movie
         fields = ("id", "title", "description", "duration", "genres", "actors")
 
-    def get_genres(self, obj: Movie) -> list[str]:
-        qs: QuerySet[Genre] = obj.genres.all()
-        return [genre.name for genre in qs]
-
-    def get_actors(self, obj: Movie) -> list[str]:
-        qs: QuerySet[Actor] = obj.actors.all()
-        result: list[str] = []
-        for actor in qs:
-            first = (actor.first_name or "").strip()
-            last = (actor.last_name or "").strip()
-            result.append(f"{first} {last}".strip())
-        return result
-
 
 class MovieDetailSerializer(serializers.ModelSerializer):
     genres = GenreSerializer(many=True, read_only=True)
@@ -135,12 +130,12 @@ class MovieSessionDetailSerializer(serializers.ModelSerializer):
         )
 
     def get_taken_places(self, obj: MovieSession) -> list[dict[str, int]]:
-        places = (
+        rows = (
             Ticket.objects.filter(movie_session=obj)
-            .values("row", "seat")
             .order_by("row", "seat")
+            .values_list("row", "seat")
         )
-        return list(places)
+        return [{"row": row, "seat": seat} for row, seat in rows]
 
 
 class MovieSessionWriteSerializer(serializers.ModelSerializer):
@@ -180,43 +175,53 @@ class TicketListSerializer(serializers.ModelSerializer):
 
 
 class OrderListSerializer(serializers.ModelSerializer):
-    tickets = TicketListSerializer(many=True, read_only=True)
+    tickets = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
         fields = ("id", "tickets", "created_at")
 
+    def get_tickets(self, obj: Order) -> list[dict[str, Any]]:
+        return TicketListSerializer(obj._tickets, many=True).data
+
+
+_datetime_field = serializers.DateTimeField()
+
+
+# Mirrors OrderListSerializer output for the order list endpoint.
+def serialize_order(order: Order) -> dict[str, Any]:
+    tickets = []
+    for ticket in order._tickets:
+        movie_session = ticket.movie_session
+        cinema_hall = movie_session.cinema_hall
+        tickets.append(
+            {
+                "id": ticket.id,
+                "row": ticket.row,
+                "seat": ticket.seat,
+                "movie_session": {
+                    "id": movie_session.id,
+                    "show_time": _datetime_field.to_representation(
+                        movie_session.show_time
+                    ),
+                    "movie_title": movie_session.movie.title,
+                    "cinema_hall_name": cinema_hall.name,
+                    "cinema_hall_capacity": cinema_hall.capacity,
+                },
+            }
+        )
+    return {
+        "id": order.id,
+        "tickets": tickets,
+        "created_at": _datetime_field.to_representation(order.created_at),
+    }
+
 
 class TicketCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
         fields = ("row", "seat", "movie_session")
 
-    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
-        row = attrs.get("row")
-        seat = attrs.get("seat")
-        movie_session: MovieSession = attrs.get("movie_session")
-
-        cinema_hall = movie_session.cinema_hall
-        if row < 1 or row > cinema_hall.rows:
-            raise serializers.ValidationError(
-                {"row": "Row number is out of range."}
-            )
-        if seat < 1 or seat > cinema_hall.seats_in_row:
-            raise serializers.ValidationError(
-                {"seat": "Seat number is out of range."}
-            )
-
-        is_taken = Ticket.objects.filter(
-            movie_session=movie_session,
-            row=row,
-            seat=seat,
-        ).exists()
-        if is_taken:
-            raise serializers.ValidationError("This place is already taken.")
-
-        return attrs
-
 
 class OrderCreateSerializer(serializers.ModelSerializer):
     tickets = TicketCreateSerializer(many=True)
@@ -230,6 +235,26 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         self,
         tickets: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
+        ms_ids = {item["movie_session"].id for item in tickets}
+        halls: dict[int, CinemaHall] = {
+            ms.id: ms.cinema_hall
+            for ms in MovieSession.objects.select_related(
+                "cinema_hall"
+            ).filter(id__in=ms_ids)
+        }
+
+        errors: list[dict[str, list[str]]] = []
+        for item in tickets:
+            cinema_hall = halls[item["movie_session"].id]
+            if not 1 <= item["row"] <= cinema_hall.rows:
+                errors.append({"row": ["Row number is out of range."]})
+            elif not 1 <= item["seat"] <= cinema_hall.seats_in_row:
+                errors.append({"seat": ["Seat number is out of range."]})
+            else:
+                errors.append({})
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
         seen: set[tuple[int, int, int]] = set()
         for item in tickets:
             ms = item["movie_session"]
@@ -249,9 +274,32 @@ class OrderCreateSerializer(serializers.ModelSerializer):
 
         order = Order.objects.create(user=user)
 
-        tickets_to_create: list[Ticket] = []
-        for ticket in tickets_data:
-            tickets_to_create.append(Ticket(order=order, **ticket))
+        tickets_to_create = [
+            Ticket(order=order, **ticket) for ticket in tickets_data
+        ]
 
-        Ticket.objects.bulk_create(tickets_to_create)
+        try:
+            with transaction.atomic():
+                Ticket.objects.bulk_create(
+                    tickets_to_create, batch_size=500
+                )
+        except IntegrityError as exc:
+            if self._has_taken_places(tickets_data):
+                raise serializers.ValidationError(
+                    {"tickets": "Place already taken."}
+                ) from exc
+            raise
         return order
+
+    @staticmethod
+    def _has_taken_places(tickets: list[dict[str, Any]]) -> bool:
+        session_ids = {item["movie_session"].id for item in tickets}
+        taken = set(
+            Ticket.objects.filter(
+                movie_session_id__in=session_ids
+            ).values_list("movie_session_id", "row", "seat")
+        )
+        return any(
+            (item["movie_session"].id, item["row"], item["seat"]) in taken
+            for item in tickets
+        )
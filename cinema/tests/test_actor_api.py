@@ -57,6 +57,15 @@ class ActorApiTests(TestCase):
                 "Johansson",
             ],
         )
+        self.assertEqual(response.data["full_name"], "Scarlett Johansson")
+
+    def test_patch_actor_full_name(self):
+        response = self.client.patch(
+            "/api/cinema/actors/1/",
+            {"last_name": "Bale"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["full_name"], "George Bale")
 
     def test_delete_actor(self):
         response = self.client.delete(
@@ -71,3 +80,9 @@ class ActorApiTests(TestCase):
             "/api/cinema/actors/1000/",
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_full_name_is_stripped(self):
+        actor = Actor.objects.create(first_name=" Kate ", last_name="")
+        response = self.client.get(f"/api/cinema/actors/{actor.id}/")
+        self.assertEqual(response.data["full_name"], "Kate")
+        self.assertEqual(actor.full_name, "Kate")
@@ -53,6 +53,16 @@ class MovieApiTests(TestCase):
         movies = self.client.get("/api/cinema/movies/?genres=123213")
         self.assertEqual(len(movies.data), 0)
 
+    def test_get_movies_with_malformed_genres_filtering(self):
+        movies = self.client.get(
+            f"/api/cinema/movies/?genres=abc{self.comedy.id},123213"
+        )
+        self.assertEqual(len(movies.data), 0)
+        movies = self.client.get(
+            f"/api/cinema/movies/?genres=abc,{self.comedy.id}"
+        )
+        self.assertEqual(len(movies.data), 1)
+
     def test_get_movies_with_actors_filtering(self):
         movies = self.client.get(
             f"/api/cinema/movies/?actors={self.actress.id}"
@@ -1,5 +1,8 @@
 from datetime import datetime
+from unittest import mock
 
+from django.db import IntegrityError
+from django.db.models import Prefetch
 from django.test import TestCase
 
 from rest_framework.test import APIClient
@@ -14,6 +17,11 @@ from cinema.models import (
     Ticket,
     Order,
 )
+from cinema.serializers import (
+    OrderCreateSerializer,
+    OrderListSerializer,
+    serialize_order,
+)
 from user.models import User
 
 
@@ -57,7 +65,7 @@ class OrderApiTests(TestCase):
         self.client.force_authenticate(user=self.user)
         orders_response = self.client.get("/api/cinema/orders/")
         self.assertEqual(orders_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(orders_response.data["count"], 1)
+        self.assertEqual(len(orders_response.data["results"]), 1)
         order = orders_response.data["results"][0]
         self.assertEqual(len(order["tickets"]), 1)
         ticket = order["tickets"][0]
@@ -68,6 +76,21 @@ class OrderApiTests(TestCase):
         self.assertEqual(movie_session["cinema_hall_name"], "White")
         self.assertEqual(movie_session["cinema_hall_capacity"], 140)
 
+    def test_serialize_order_matches_order_list_serializer(self):
+        order = Order.objects.prefetch_related(
+            Prefetch(
+                "tickets",
+                queryset=Ticket.objects.select_related(
+                    "movie_session__movie",
+                    "movie_session__cinema_hall",
+                ),
+                to_attr="_tickets",
+            )
+        ).get(pk=self.order.pk)
+        self.assertEqual(
+            serialize_order(order), OrderListSerializer(order).data
+        )
+
     def test_movie_session_detail_tickets(self):
         response = self.client.get(
             f"/api/cinema/movie_sessions/{self.movie_session.id}/"
@@ -87,3 +110,94 @@ class OrderApiTests(TestCase):
             response.data[0]["tickets_available"],
             self.cinema_hall.capacity - 1,
         )
+
+    def test_create_order(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": 1,
+                        "seat": 1,
+                        "movie_session": self.movie_session.id,
+                    },
+                    {
+                        "row": 1,
+                        "seat": 2,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Ticket.objects.filter(movie_session=self.movie_session).count(),
+            3,
+        )
+
+    def test_create_order_with_taken_place(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": self.ticket.row,
+                        "seat": self.ticket.seat,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_create_order_with_place_out_of_range(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": 1,
+                        "seat": 1,
+                        "movie_session": self.movie_session.id,
+                    },
+                    {
+                        "row": self.cinema_hall.rows + 1,
+                        "seat": 1,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["tickets"],
+            [{}, {"row": ["Row number is out of range."]}],
+        )
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_create_order_integrity_error_for_free_place_is_not_masked(self):
+        serializer = OrderCreateSerializer(
+            data={
+                "tickets": [
+                    {
+                        "row": 1,
+                        "seat": 1,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            context={"request": mock.Mock(user=self.user)},
+        )
+        self.assertTrue(serializer.is_valid())
+        with mock.patch.object(
+            Ticket.objects, "bulk_create", side_effect=IntegrityError
+        ):
+            with self.assertRaises(IntegrityError):
+                serializer.save()
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import re
 from typing import Type
 
 from django.db.models import (
     Count,
+    Exists,
     ExpressionWrapper,
     F,
     IntegerField,
+    OuterRef,
+    Prefetch,
     QuerySet,
+    Subquery,
+    Value,
 )
+from django.db.models.functions import Coalesce, Concat, Trim
 from django.utils.dateparse import parse_date
 from rest_framework import serializers, viewsets
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
 
 from cinema.models import (
     Actor,
@@ -21,6 +30,7 @@ from cinema.models import (
     Movie,
     MovieSession,
     Order,
+    Ticket,
 )
 from cinema.serializers import (
     ActorSerializer,
@@ -34,16 +44,40 @@ from cinema.serializers import (
     MovieWriteSerializer,
     OrderCreateSerializer,
     OrderListSerializer,
+    serialize_order,
 )
 
 
+_INT_RE = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+
+
 def _parse_int_list(value: str) -> list[int]:
-    result = []
-    for part in value.split(","):
-        part = part.strip()
-        if part.isdigit():
-            result.append(int(part))
-    return result
+    return [int(part) for part in _INT_RE.findall(value)]
+
+
+def _actors_queryset() -> QuerySet[Actor]:
+    return Actor.objects.annotate(
+        _full_name=Trim(
+            Concat(Trim("first_name"), Value(" "), Trim("last_name"))
+        )
+    )
+
+
+class QuerySetCacheMixin:
+    # DRF may call get_queryset() several times per request; build it once
+    # and hand out fresh clones so result caches are never shared.
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        self._queryset_cache = None
+        super().initial(request, *args, **kwargs)
+
+    def get_queryset(self) -> QuerySet:
+        if getattr(self, "_queryset_cache", None) is None:
+            self._queryset_cache = self.build_queryset(super().get_queryset())
+        return self._queryset_cache.all()
+
+    def build_queryset(self, qs: QuerySet) -> QuerySet:
+        return qs
 
 
 class GenreViewSet(viewsets.ModelViewSet):
@@ -52,7 +86,7 @@ class GenreViewSet(viewsets.ModelViewSet):
 
 
 class ActorViewSet(viewsets.ModelViewSet):
-    queryset = Actor.objects.all()
+    queryset = _actors_queryset()
     serializer_class = ActorSerializer
 
 
@@ -61,12 +95,18 @@ class CinemaHallViewSet(viewsets.ModelViewSet):
     serializer_class = CinemaHallSerializer
 
 
-class MovieViewSet(viewsets.ModelViewSet):
-    queryset = Movie.objects.prefetch_related("genres", "actors")
-
-    def get_queryset(self) -> QuerySet[Movie]:
-        qs = super().get_queryset()
+class MovieViewSet(QuerySetCacheMixin, viewsets.ModelViewSet):
+    queryset = Movie.objects.prefetch_related(
+        Prefetch("genres", queryset=Genre.objects.only("id", "name")),
+        Prefetch(
+            "actors",
+            queryset=_actors_queryset().only(
+                "id", "first_name", "last_name"
+            ),
+        ),
+    )
 
+    def build_queryset(self, qs: QuerySet[Movie]) -> QuerySet[Movie]:
         title = self.request.query_params.get("title")
         if title:
             qs = qs.filter(title__icontains=title)
@@ -75,15 +115,29 @@ class MovieViewSet(viewsets.ModelViewSet):
         if genres:
             genre_ids = _parse_int_list(genres)
             if genre_ids:
-                qs = qs.filter(genres__id__in=genre_ids)
+                qs = qs.filter(
+                    Exists(
+                        Movie.genres.through.objects.filter(
+                            movie_id=OuterRef("pk"),
+                            genre_id__in=genre_ids,
+                        )
+                    )
+                )
 
         actors = self.request.query_params.get("actors")
         if actors:
             actor_ids = _parse_int_list(actors)
             if actor_ids:
-                qs = qs.filter(actors__id__in=actor_ids)
+                qs = qs.filter(
+                    Exists(
+                        Movie.actors.through.objects.filter(
+                            movie_id=OuterRef("pk"),
+                            actor_id__in=actor_ids,
+                        )
+                    )
+                )
 
-        return qs.distinct()
+        return qs
 
     def get_serializer_class(self) -> Type[serializers.Serializer]:
         if self.action == "list":
@@ -93,18 +147,24 @@ class MovieViewSet(viewsets.ModelViewSet):
         return MovieWriteSerializer
 
 
-class MovieSessionViewSet(viewsets.ModelViewSet):
+class MovieSessionViewSet(QuerySetCacheMixin, viewsets.ModelViewSet):
     queryset = (
         MovieSession.objects.select_related(
             "movie",
             "cinema_hall",
         )
-        .prefetch_related(
-            "movie__genres",
-            "movie__actors",
-        )
         .annotate(
-            tickets_sold=Count("tickets", distinct=True),
+            tickets_sold=Coalesce(
+                Subquery(
+                    Ticket.objects.filter(movie_session=OuterRef("pk"))
+                    .order_by()
+                    .values("movie_session")
+                    .annotate(count=Count("*"))
+                    .values("count"),
+                    output_field=IntegerField(),
+                ),
+                0,
+            ),
             hall_capacity=ExpressionWrapper(
                 F("cinema_hall__rows")
                 * F("cinema_hall__seats_in_row"),
@@ -119,9 +179,9 @@ class MovieSessionViewSet(viewsets.ModelViewSet):
         )
     )
 
-    def get_queryset(self) -> QuerySet[MovieSession]:
-        qs = super().get_queryset()
-
+    def build_queryset(
+        self, qs: QuerySet[MovieSession]
+    ) -> QuerySet[MovieSession]:
         date_str = self.request.query_params.get("date")
         if date_str:
             date_value = parse_date(date_str)
@@ -132,6 +192,22 @@ class MovieSessionViewSet(viewsets.ModelViewSet):
         if movie and movie.isdigit():
             qs = qs.filter(movie_id=int(movie))
 
+        if self.action == "list":
+            qs = qs.only(
+                "id",
+                "show_time",
+                "movie__title",
+                "cinema_hall__name",
+                "cinema_hall__rows",
+                "cinema_hall__seats_in_row",
+            )
+
+        if self.action == "retrieve":
+            qs = qs.prefetch_related(
+                "movie__genres",
+                Prefetch("movie__actors", queryset=_actors_queryset()),
+            )
+
         return qs
 
     def get_serializer_class(self) -> Type[serializers.Serializer]:
@@ -142,25 +218,39 @@ class MovieSessionViewSet(viewsets.ModelViewSet):
         return MovieSessionWriteSerializer
 
 
-class OrderPagination(PageNumberPagination):
-    page_size = 1
+class OrderPagination(CursorPagination):
+    page_size = 20
+    ordering = "-created_at"
 
 
 class OrderViewSet(viewsets.ModelViewSet):
     permission_classes = (IsAuthenticated,)
-    queryset = Order.objects.all()
+    queryset = Order.objects.none()
     pagination_class = OrderPagination
 
     def get_queryset(self) -> QuerySet[Order]:
         return (
-            super()
-            .get_queryset()
-            .filter(user=self.request.user)
+            Order.objects.for_user(self.request.user)
             .prefetch_related(
-                "tickets__movie_session__movie",
-                "tickets__movie_session__cinema_hall",
+                Prefetch(
+                    "tickets",
+                    queryset=Ticket.objects.select_related(
+                        "movie_session__movie",
+                        "movie_session__cinema_hall",
+                    ),
+                    to_attr="_tickets",
+                )
             )
-            .order_by("-created_at")
+        )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        queryset = self.filter_queryset(self.get_queryset())
+
+        # OrderPagination always paginates, so each response is bounded
+        # by its page size.
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(
+            [serialize_order(order) for order in page]
         )
 
     def get_serializer_class(self) -> Type[serializers.Serializer]: